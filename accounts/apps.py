@@ -1,6 +1,30 @@
+import atexit
+import logging
+
 from django.apps import AppConfig
 
 
+# QueueListeners started by _start_log_queue_listeners(), so a repeated
+# ready() call never starts one twice
+_started_listeners = set()
+
+
+def _start_log_queue_listeners():
+    """
+    Start the QueueListener attached to each QueueHandler configured via LOGGING.
+
+    dictConfig creates the listeners but leaves them stopped, so queued records
+    would never reach their target handlers without this. Each listener is
+    stopped at interpreter exit, which flushes the records still queued.
+    """
+    for name in logging.getHandlerNames():
+        listener = getattr(logging.getHandlerByName(name), 'listener', None)
+        if listener is not None and listener not in _started_listeners:
+            listener.start()
+            _started_listeners.add(listener)
+            atexit.register(listener.stop)
+
+
 class AccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'accounts'
@@ -12,4 +36,4 @@ class AccountsConfig(AppConfig):
         """
         # Import signals to ensure they are registered
         # (Add signal imports here when signal handlers are implemented)
-        pass
+        _start_log_queue_listeners()
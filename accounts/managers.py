@@ -11,6 +11,7 @@ from typing import Any, Optional, TYPE_CHECKING
 from contextvars import ContextVar
 from datetime import timedelta
 
+from django.conf import settings
 from django.db import models
 from django.db.models import Q
 from django.core.cache import cache
@@ -155,7 +156,15 @@ class TenantCacheManager:
     database queries for tenant resolution.
     """
     
-    CACHE_TIMEOUT = 300  # 5 minutes
+    @classmethod
+    def get_cache_timeout(cls) -> int:
+        """
+        Get the tenant cache timeout in seconds.
+
+        Read from settings on each call (not at import time), so
+        override_settings and late-loaded settings take effect.
+        """
+        return settings.TENANT_SETTINGS.TENANT_CACHE_TIMEOUT
     
     @classmethod
     def get_tenant_by_slug(cls, slug: str) -> Optional[TenantAccount]:
@@ -179,10 +188,10 @@ class TenantCacheManager:
                     tenant_slug=slug,
                     is_active=True
                 )
-                cache.set(cache_key, tenant, cls.CACHE_TIMEOUT)
+                cache.set(cache_key, tenant, cls.get_cache_timeout())
             except TenantAccount.DoesNotExist:
                 # Cache the None result to avoid repeated DB hits
-                cache.set(cache_key, None, cls.CACHE_TIMEOUT)
+                cache.set(cache_key, None, cls.get_cache_timeout())
                 return None
 
         return tenant
@@ -228,7 +237,7 @@ class TenantCacheManager:
                                         if tenant.max_member_accounts > 0 else 0,
                     'subscription_status': tenant.get_subscription_status(),
                 }
-                cache.set(cache_key, stats, cls.CACHE_TIMEOUT)
+                cache.set(cache_key, stats, cls.get_cache_timeout())
             except TenantAccount.DoesNotExist:
                 return None
 
@@ -303,6 +312,19 @@ class OrganizationAwareManager(TenantAwareManager):
         """
         return self.get_queryset().filter(organization=organization)
     
+    def for_tenant_id(self, tenant_id: int) -> QuerySet[Any]:
+        """
+        Get active records for a tenant by ID, without touching the TenantAccount.
+
+        Args:
+            tenant_id: Primary key of the tenant (e.g. request.tenant_id)
+
+        Returns:
+            QuerySet of active records filtered by tenant_id
+            (still respects context filtering)
+        """
+        return self.get_queryset().filter(tenant_id=tenant_id, is_active=True)
+
     def organization_members(self, organization: Organization) -> QuerySet[Any]:
         """
         Get organization members (alias for for_organization).
@@ -326,4 +348,4 @@ class OrganizationAwareManager(TenantAwareManager):
             QuerySet of all organization members regardless of tenant
         """
         # Use all_objects to bypass tenant filtering, then filter by organization
-        return self.model.all_objects.filter(organization=organization)
\ No newline at end of file
+        return self.model.all_objects.filter(organization=organization)
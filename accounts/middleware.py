@@ -41,9 +41,12 @@ class TenantContextMiddleware:
         if tenant:
             set_current_tenant(tenant)
             request.tenant = tenant
+            # Plain ID for queries that only need the tenant predicate
+            request.tenant_id = tenant.pk
             logger.debug(f"Set tenant context: {tenant.tenant_slug}")
         else:
             request.tenant = None
+            request.tenant_id = None
 
         # Process the request
         response = self.get_response(request)
@@ -208,6 +211,7 @@ class AdminTenantContextMiddleware:
                 tenant = TenantAccount.objects.get(id=tenant_id, is_active=True)
                 set_current_tenant(tenant)
                 request.tenant = tenant
+                request.tenant_id = tenant.pk
             except TenantAccount.DoesNotExist:
                 request.session.pop("selected_tenant_id", None)
 
@@ -261,7 +265,7 @@ class TenantAccessControlMiddleware:
         try:
             from people.models import UserProfile
 
-            user_profile = UserProfile.objects.get(user=user)
+            user_profile = UserProfile.objects.select_related("contact").get(user=user)
 
             # Use the utility method if available
             if hasattr(user_profile, "can_access_tenant"):
@@ -14,7 +14,7 @@ from datetime import date, timedelta
 
 from accounts.models import TenantAccount, MemberAccount
 from accounts.managers import set_current_tenant, get_current_tenant, TenantCacheManager
-from accounts.middleware import TenantContextMiddleware
+from accounts.middleware import AdminTenantContextMiddleware, TenantContextMiddleware
 from people.models import Contact
 
 
@@ -470,6 +470,16 @@ class TenantCacheManagerTestCase(TestCase):
         tenant = TenantCacheManager.get_tenant_by_slug('cache-test')
         self.assertEqual(tenant, self.tenant1)
 
+    def test_cache_timeout_follows_settings(self):
+        """Test the cache timeout is read from settings at call time."""
+        from dataclasses import replace
+        from django.conf import settings
+
+        with override_settings(
+            TENANT_SETTINGS=replace(settings.TENANT_SETTINGS, TENANT_CACHE_TIMEOUT=42)
+        ):
+            self.assertEqual(TenantCacheManager.get_cache_timeout(), 42)
+
 
 @override_settings(ALLOWED_HOSTS=['*'])
 class TenantMiddlewareTestCase(TestCase):
@@ -538,6 +548,29 @@ class TenantMiddlewareTestCase(TestCase):
         self.assertIn(b'middleware-test', response.content)
         self.assertTrue(hasattr(request, 'tenant'))
         self.assertEqual(request.tenant, self.tenant1)
+        self.assertEqual(request.tenant_id, self.tenant1.pk)
+
+    def test_admin_middleware_sets_tenant_id(self):
+        """Test that the admin tenant selection also updates request.tenant_id."""
+        def get_response(request):
+            from django.http import HttpResponse
+            return HttpResponse()
+
+        request = self.factory.get('/admin/')
+        request.user = User.objects.create_superuser(
+            username='admin-middleware', email='admin-middleware@example.com', password='pw'
+        )
+        request.session = {'selected_tenant_id': self.tenant1.pk}
+
+        # As left by TenantContextMiddleware when it resolved no tenant
+        request.tenant = None
+        request.tenant_id = None
+
+        AdminTenantContextMiddleware(get_response)(request)
+
+        self.assertEqual(request.tenant, self.tenant1)
+        self.assertEqual(request.tenant_id, self.tenant1.pk)
+        set_current_tenant(None)
 
 
 class TenantIsolationIntegrationTestCase(TestCase):
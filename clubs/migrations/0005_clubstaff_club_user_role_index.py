@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-16 05:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clubs', '0004_rename_loginuser_to_userprofile'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='clubstaff',
+            name='clubs_clubs_organiz_2dd47c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='clubstaff',
+            index=models.Index(fields=['club', 'user', 'role'], name='clubs_clubs_club_id_ae3680_idx'),
+        ),
+    ]
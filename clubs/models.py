@@ -310,13 +310,15 @@ class ClubStaff(models.Model):
             models.Index(fields=["club", "is_active"]),
             models.Index(fields=["user", "is_active"]),
             models.Index(fields=["role"]),
-            models.Index(fields=["organization_user"]),
+            # Covers role-filtered staff lookups for a user within a club
+            models.Index(fields=["club", "user", "role"]),
         ]
         constraints = [
             models.UniqueConstraint(
                 fields=["club", "user"], name="unique_staff_assignment_per_club"
             ),
-            # Note: organization_user already has unique constraint from OneToOneField
+            # Note: organization_user already has a unique index from OneToOneField,
+            # so it needs no separate index or constraint
         ]
         verbose_name = "Club Staff"
         verbose_name_plural = "Club Staff"
@@ -360,7 +362,12 @@ class ClubStaff(models.Model):
 
     def save(self, *args, **kwargs):
         self.full_clean()
+        # Role/organization_user may have changed; drop the memoized level
+        self.__dict__.pop("_hierarchy_level", None)
         super().save(*args, **kwargs)
+        # Ownership may have changed; drop the loaded profile's cached answer
+        if ClubStaff.user.is_cached(self):
+            self.user.__dict__.pop("_is_owner_of_any", None)
 
     def get_organization_user(self):
         """Get the associated OrganizationUser if it exists."""
@@ -375,12 +382,43 @@ class ClubStaff(models.Model):
             if self.role in ["owner", "admin"]:
                 self.can_view_finances = True
 
+    @classmethod
+    def sync_with_organization_bulk(cls, queryset, batch_size=500):
+        """
+        Apply sync_with_organization to every staff row in queryset.
+
+        Permissions are computed in Python and written back with a single
+        bulk_update per batch instead of one save() (and full_clean) per row.
+
+        Returns:
+            Number of staff assignments updated
+        """
+        staff_list = list(queryset.select_related("organization_user"))
+        for staff in staff_list:
+            staff.sync_with_organization()
+        return cls.all_objects.bulk_update(
+            staff_list,
+            fields=["can_manage_members", "can_manage_schedule", "can_view_finances"],
+            batch_size=batch_size,
+        )
+
     def is_organization_admin(self):
         """Check if the user is an organization admin."""
         return self.organization_user and self.organization_user.is_admin
 
     def get_permission_hierarchy_level(self):
-        """Get the permission hierarchy level for this staff assignment."""
+        """
+        Get the permission hierarchy level for this staff assignment.
+
+        The level is memoized on the instance (cleared on save) because computing
+        it loads the related User and OrganizationUser rows.
+        """
+        if "_hierarchy_level" not in self.__dict__:
+            self._hierarchy_level = self._compute_permission_hierarchy_level()
+        return self._hierarchy_level
+
+    def _compute_permission_hierarchy_level(self):
+        """Compute the permission hierarchy level from user, org and role."""
         if self.user.user.is_superuser:
             return 100  # Superuser
         if self.is_organization_admin():
@@ -399,7 +437,7 @@ class ClubStaff(models.Model):
         """Check if this staff member can manage another staff member."""
         if not isinstance(other_staff, ClubStaff):
             return False
-        if other_staff.club != self.club:
+        if other_staff.club_id != self.club_id:
             return False  # Can only manage staff in same club
 
         # Higher hierarchy level can manage lower level
@@ -1,5 +1,6 @@
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.test import TestCase
 from django.utils import timezone
 from organizations.models import Organization
@@ -199,24 +200,27 @@ class ClubTenantIsolationTestCase(TestCase):
         )
 
         # Create contacts for each tenant
-        self.contact1 = Contact.objects.create(
-            first_name="John",
-            last_name="Staff1",
-            email="staff1@test.com",
-            date_of_birth="1980-01-01",
-            address="123 Test St",
-            mobile_number="123-456-7890",
-            tenant=self.tenant1,
-        )
-
-        self.contact2 = Contact.objects.create(
-            first_name="Jane",
-            last_name="Staff2",
-            email="staff2@test.com",
-            date_of_birth="1981-01-01",
-            address="456 Test Ave",
-            mobile_number="987-654-3210",
-            tenant=self.tenant2,
+        self.contact1, self.contact2 = Contact.objects.bulk_create(
+            [
+                Contact(
+                    first_name="John",
+                    last_name="Staff1",
+                    email="staff1@test.com",
+                    date_of_birth="1980-01-01",
+                    address="123 Test St",
+                    mobile_number="123-456-7890",
+                    tenant=self.tenant1,
+                ),
+                Contact(
+                    first_name="Jane",
+                    last_name="Staff2",
+                    email="staff2@test.com",
+                    date_of_birth="1981-01-01",
+                    address="456 Test Ave",
+                    mobile_number="987-654-3210",
+                    tenant=self.tenant2,
+                ),
+            ]
         )
 
         # Create clubs for each tenant
@@ -324,34 +328,36 @@ class ClubStaffFilteringTestCase(TestCase):
         )
 
         # Create contacts for each tenant
-        self.contact1 = Contact.objects.create(
-            first_name="John",
-            last_name="Staff1",
-            email="staff1@test.com",
-            date_of_birth="1980-01-01",
-            address="123 Test St",
-            mobile_number="123-456-7890",
-            tenant=self.tenant1,
-        )
-
-        self.contact2 = Contact.objects.create(
-            first_name="Jane",
-            last_name="Staff2",
-            email="staff2@test.com",
-            date_of_birth="1981-01-01",
-            address="456 Test Ave",
-            mobile_number="987-654-3210",
-            tenant=self.tenant1,
-        )
-
-        self.contact3 = Contact.objects.create(
-            first_name="Bob",
-            last_name="Admin",
-            email="admin@test.com",
-            date_of_birth="1975-01-01",
-            address="789 Admin St",
-            mobile_number="555-123-4567",
-            tenant=self.tenant1,
+        self.contact1, self.contact2, self.contact3 = Contact.objects.bulk_create(
+            [
+                Contact(
+                    first_name="John",
+                    last_name="Staff1",
+                    email="staff1@test.com",
+                    date_of_birth="1980-01-01",
+                    address="123 Test St",
+                    mobile_number="123-456-7890",
+                    tenant=self.tenant1,
+                ),
+                Contact(
+                    first_name="Jane",
+                    last_name="Staff2",
+                    email="staff2@test.com",
+                    date_of_birth="1981-01-01",
+                    address="456 Test Ave",
+                    mobile_number="987-654-3210",
+                    tenant=self.tenant1,
+                ),
+                Contact(
+                    first_name="Bob",
+                    last_name="Admin",
+                    email="admin@test.com",
+                    date_of_birth="1975-01-01",
+                    address="789 Admin St",
+                    mobile_number="555-123-4567",
+                    tenant=self.tenant1,
+                ),
+            ]
         )
 
         # Create clubs
@@ -384,12 +390,9 @@ class ClubStaffFilteringTestCase(TestCase):
         self.user_profile3 = UserProfile.objects.create(
             user=self.user3,
             contact=self.contact3,
-        )
-        self.user_profile3.is_system_admin = True
-        self.user_profile3.can_create_clubs = True
-        self.user_profile3.can_manage_members = True
-        self.user_profile3.save(
-            update_fields=["is_system_admin", "can_create_clubs", "can_manage_members"]
+            is_system_admin=True,
+            can_create_clubs=True,
+            can_manage_members=True,
         )
 
         # Create staff assignments
@@ -587,6 +590,73 @@ class ClubStaffFilteringTestCase(TestCase):
         all_staff = ClubStaff.all_objects.all()
         self.assertEqual(all_staff.count(), 2)  # All staff across all tenants
 
+    def test_get_managed_clubs(self):
+        """Test UserProfile.get_managed_clubs for staff and system admins"""
+        # Regular staff: only clubs with an active assignment
+        self.assertEqual(list(self.user_profile1.get_managed_clubs()), [self.club1])
+
+        self.staff1_club1.is_active = False
+        self.staff1_club1.save()
+        self.assertEqual(list(self.user_profile1.get_managed_clubs()), [])
+
+        # System admin: all clubs in their tenant
+        self.assertEqual(
+            list(self.user_profile3.get_managed_clubs()), [self.club1, self.club2]
+        )
+
+    def test_get_club_permissions_summary(self):
+        """Test UserProfile.get_club_permissions_summary classifies clubs by role"""
+        ClubStaff.objects.create(club=self.club2, user=self.user_profile1, role="owner")
+
+        with self.assertNumQueries(0):  # Club lists are loaded lazily
+            summary = self.user_profile1.get_club_permissions_summary()
+
+        with self.assertNumQueries(2):  # Assignments, then the clubs
+            self.assertEqual(summary["all_clubs"], [self.club1, self.club2])
+            self.assertEqual(summary["owned_clubs"], [self.club2])
+            self.assertEqual(summary["managed_clubs"], [self.club2])
+        self.assertFalse(summary["is_admin"])
+
+    def test_is_club_owner_uses_prefetched_assignments(self):
+        """Test is_club_owner answers from prefetched club_assignments"""
+        ClubStaff.objects.create(club=self.club2, user=self.user_profile1, role="owner")
+        profile = UserProfile.objects.with_club_assignments().get(
+            pk=self.user_profile1.pk
+        )
+
+        with self.assertNumQueries(0):
+            self.assertTrue(profile.is_club_owner())
+            self.assertTrue(profile.is_club_owner(self.club2))
+            self.assertFalse(profile.is_club_owner(self.club1))
+
+    def test_get_club_permissions_counts(self):
+        """Test UserProfile.get_club_permissions_counts uses a single aggregate"""
+        ClubStaff.objects.create(club=self.club2, user=self.user_profile1, role="owner")
+
+        with self.assertNumQueries(1):
+            counts = self.user_profile1.get_club_permissions_counts()
+
+        self.assertEqual(
+            counts, {"owned_count": 1, "managed_count": 1, "all_count": 2}
+        )
+
+    def test_get_club_permissions_counts_respects_tenant_context(self):
+        """Test get_club_permissions_counts matches the tenant-scoped club lists"""
+        from accounts.managers import set_current_tenant
+
+        ClubStaff.objects.create(club=self.club2, user=self.user_profile1, role="owner")
+
+        # The profile's clubs all belong to tenant1
+        set_current_tenant(self.tenant2)
+        counts = self.user_profile1.get_club_permissions_counts()
+        lists = self.user_profile1.get_club_permissions_lists()
+
+        self.assertEqual(
+            counts, {"owned_count": 0, "managed_count": 0, "all_count": 0}
+        )
+        self.assertEqual(counts["all_count"], len(lists["all_clubs"]))
+        self.assertEqual(counts["owned_count"], len(lists["owned_clubs"]))
+
     def tearDown(self):
         """Clean up context after each test"""
         from accounts.managers import set_current_tenant
@@ -596,10 +666,13 @@ class ClubStaffFilteringTestCase(TestCase):
         set_current_user(None)
 
 
-class ClubStaffOrganizationUserTestCase(TestCase):
-    def setUp(self):
+class ClubStaffOrganizationUserTestBase(TestCase):
+    """Shared tenant/club/OrganizationUser fixture, created once per subclass."""
+
+    @classmethod
+    def setUpTestData(cls):
         # Create tenant
-        self.tenant = TenantAccount.objects.create(
+        cls.tenant = TenantAccount.objects.create(
             tenant_name="Test Tenant",
             tenant_slug="test-tenant",
             billing_email="billing@test.com",
@@ -607,66 +680,67 @@ class ClubStaffOrganizationUserTestCase(TestCase):
         )
 
         # Create contacts
-        self.contact1 = Contact.objects.create(
-            first_name="John",
-            last_name="Owner",
-            email="owner@test.com",
-            date_of_birth="1980-01-01",
-            address="123 Test St",
-            mobile_number="123-456-7890",
-            tenant=self.tenant,
-        )
-
-        self.contact2 = Contact.objects.create(
-            first_name="Jane",
-            last_name="Admin",
-            email="admin@test.com",
-            date_of_birth="1981-01-01",
-            address="456 Test Ave",
-            mobile_number="987-654-3210",
-            tenant=self.tenant,
+        cls.contact1, cls.contact2 = Contact.objects.bulk_create(
+            [
+                Contact(
+                    first_name="John",
+                    last_name="Owner",
+                    email="owner@test.com",
+                    date_of_birth="1980-01-01",
+                    address="123 Test St",
+                    mobile_number="123-456-7890",
+                    tenant=cls.tenant,
+                ),
+                Contact(
+                    first_name="Jane",
+                    last_name="Admin",
+                    email="admin@test.com",
+                    date_of_birth="1981-01-01",
+                    address="456 Test Ave",
+                    mobile_number="987-654-3210",
+                    tenant=cls.tenant,
+                ),
+            ]
         )
 
         # Create club
-        self.club = Club.objects.create(
-            name="Test Club", slug="test-club", tenant=self.tenant
+        cls.club = Club.objects.create(
+            name="Test Club", slug="test-club", tenant=cls.tenant
         )
 
         # Create Django users and UserProfiles
-        self.django_user1 = User.objects.create_user("owner", "owner@test.com")
-        self.user_profile1 = UserProfile.objects.create(
-            user=self.django_user1,
-            contact=self.contact1,
-        )
-        self.user_profile1.can_create_clubs = True
-        self.user_profile1.can_manage_members = True
-        self.user_profile1.save(
-            update_fields=["can_create_clubs", "can_manage_members"]
+        cls.django_user1 = User.objects.create_user("owner", "owner@test.com")
+        cls.user_profile1 = UserProfile.objects.create(
+            user=cls.django_user1,
+            contact=cls.contact1,
+            can_create_clubs=True,
+            can_manage_members=True,
         )
 
-        self.django_user2 = User.objects.create_user("admin", "admin@test.com")
-        self.user_profile2 = UserProfile.objects.create(
-            user=self.django_user2,
-            contact=self.contact2,
-        )
-        self.user_profile2.is_system_admin = True
-        self.user_profile2.can_create_clubs = True
-        self.user_profile2.can_manage_members = True
-        self.user_profile2.save(
-            update_fields=["is_system_admin", "can_create_clubs", "can_manage_members"]
+        cls.django_user2 = User.objects.create_user("admin", "admin@test.com")
+        cls.user_profile2 = UserProfile.objects.create(
+            user=cls.django_user2,
+            contact=cls.contact2,
+            is_system_admin=True,
+            can_create_clubs=True,
+            can_manage_members=True,
         )
 
         # Create OrganizationUsers for the club (since Club inherits from Organization)
         from organizations.models import OrganizationUser
 
-        self.org_user1 = OrganizationUser.objects.create(
-            user=self.django_user1, organization=self.club, is_admin=False
+        cls.org_user1 = OrganizationUser.objects.create(
+            user=cls.django_user1, organization=cls.club, is_admin=False
         )
 
-        self.org_user2 = OrganizationUser.objects.create(
-            user=self.django_user2, organization=self.club, is_admin=True
+        cls.org_user2 = OrganizationUser.objects.create(
+            user=cls.django_user2, organization=cls.club, is_admin=True
         )
 
+
+class ClubStaffOrganizationUserTestCase(ClubStaffOrganizationUserTestBase):
+    """ClubStaff creation and OrganizationUser consistency validation"""
+
     def test_club_staff_creation_with_organization_user(self):
         """Test creating ClubStaff with valid OrganizationUser"""
         staff = ClubStaff.objects.create(
@@ -743,6 +817,10 @@ class ClubStaffOrganizationUserTestCase(TestCase):
             "OrganizationUser must belong to the same Organization", str(cm.exception)
         )
 
+
+class ClubStaffHierarchyTestCase(ClubStaffOrganizationUserTestBase):
+    """ClubStaff organization-admin detection and permission hierarchy"""
+
     def test_organization_admin_detection(self):
         """Test is_organization_admin method"""
         # Create additional user to avoid unique constraint violation
@@ -805,12 +883,9 @@ class ClubStaffOrganizationUserTestCase(TestCase):
         super_login = UserProfile.objects.create(
             user=superuser,
             contact=super_contact,
-        )
-        super_login.is_system_admin = True
-        super_login.can_create_clubs = True
-        super_login.can_manage_members = True
-        super_login.save(
-            update_fields=["is_system_admin", "can_create_clubs", "can_manage_members"]
+            is_system_admin=True,
+            can_create_clubs=True,
+            can_manage_members=True,
         )
 
         # Create additional users for different roles
@@ -827,10 +902,9 @@ class ClubStaffOrganizationUserTestCase(TestCase):
         owner_login = UserProfile.objects.create(
             user=owner_user,
             contact=owner_contact,
+            can_create_clubs=True,
+            can_manage_members=True,
         )
-        owner_login.can_create_clubs = True
-        owner_login.can_manage_members = True
-        owner_login.save(update_fields=["can_create_clubs", "can_manage_members"])
 
         admin_user = User.objects.create_user("admin_test", "admin_test@test.com")
         admin_contact = Contact.objects.create(
@@ -845,12 +919,9 @@ class ClubStaffOrganizationUserTestCase(TestCase):
         admin_login = UserProfile.objects.create(
             user=admin_user,
             contact=admin_contact,
-        )
-        admin_login.is_system_admin = True
-        admin_login.can_create_clubs = True
-        admin_login.can_manage_members = True
-        admin_login.save(
-            update_fields=["is_system_admin", "can_create_clubs", "can_manage_members"]
+            is_system_admin=True,
+            can_create_clubs=True,
+            can_manage_members=True,
         )
 
         instructor_user = User.objects.create_user(
@@ -922,6 +993,10 @@ class ClubStaffOrganizationUserTestCase(TestCase):
         self.assertEqual(staff_instructor.get_permission_hierarchy_level(), 50)
         self.assertEqual(staff_assistant.get_permission_hierarchy_level(), 30)
 
+
+class ClubStaffManageStaffTestCase(ClubStaffOrganizationUserTestBase):
+    """ClubStaff.can_manage_staff_member hierarchy checks"""
+
     def test_can_manage_staff_member(self):
         """Test staff management permissions based on hierarchy"""
         # Create additional users to avoid unique constraint violations
@@ -938,10 +1013,9 @@ class ClubStaffOrganizationUserTestCase(TestCase):
         owner_login = UserProfile.objects.create(
             user=owner_user,
             contact=owner_contact,
+            can_create_clubs=True,
+            can_manage_members=True,
         )
-        owner_login.can_create_clubs = True
-        owner_login.can_manage_members = True
-        owner_login.save(update_fields=["can_create_clubs", "can_manage_members"])
 
         instructor_user = User.objects.create_user(
             "instructor_manage", "instructor_manage@test.com"
@@ -1012,6 +1086,21 @@ class ClubStaffOrganizationUserTestCase(TestCase):
             instructor.can_manage_staff_member(owner)
         )  # Instructor cannot manage owner
 
+    def test_hierarchy_level_refreshed_after_role_change(self):
+        """Test memoized hierarchy level is recomputed after save"""
+        staff = ClubStaff.objects.create(
+            club=self.club, user=self.user_profile1, role="assistant"
+        )
+        self.assertEqual(staff.get_permission_hierarchy_level(), 30)
+
+        staff.role = "owner"
+        staff.save()
+        self.assertEqual(staff.get_permission_hierarchy_level(), 80)
+
+
+class ClubStaffOrganizationSyncTestCase(ClubStaffOrganizationUserTestBase):
+    """ClubStaff.sync_with_organization behaviour"""
+
     def test_sync_with_organization_permissions(self):
         """Test syncing permissions with organization-level permissions"""
         # Organization admin gets elevated permissions
@@ -1038,6 +1127,38 @@ class ClubStaffOrganizationUserTestCase(TestCase):
         staff_org_admin.sync_with_organization()
         self.assertTrue(staff_org_admin.can_view_finances)
 
+    def test_sync_with_organization_bulk(self):
+        """Test bulk sync persists organization-derived permissions"""
+        staff_org_admin = ClubStaff.objects.create(
+            club=self.club,
+            user=self.user_profile2,
+            organization_user=self.org_user2,  # is_admin=True
+            role="instructor",
+        )
+        staff_member = ClubStaff.objects.create(
+            club=self.club,
+            user=self.user_profile1,
+            organization_user=self.org_user1,  # is_admin=False
+            role="instructor",
+        )
+
+        updated = ClubStaff.sync_with_organization_bulk(
+            ClubStaff.all_objects.filter(club=self.club)
+        )
+        self.assertEqual(updated, 2)
+
+        staff_org_admin.refresh_from_db()
+        staff_member.refresh_from_db()
+        self.assertTrue(staff_org_admin.can_manage_members)
+        self.assertTrue(staff_org_admin.can_manage_schedule)
+        self.assertFalse(staff_org_admin.can_view_finances)
+        self.assertFalse(staff_member.can_manage_members)
+        self.assertFalse(staff_member.can_manage_schedule)
+
+
+class ClubStaffOneToOneConstraintTestCase(ClubStaffOrganizationUserTestBase):
+    """OneToOne constraint on ClubStaff.organization_user"""
+
     def test_onetoone_constraint_enforcement(self):
         """Test that OneToOne constraint is enforced"""
         # Create first staff assignment with organization user
@@ -1049,7 +1170,8 @@ class ClubStaffOrganizationUserTestCase(TestCase):
         )
 
         # Try to create second staff assignment with same organization user
-        with self.assertRaises(Exception):  # Should raise IntegrityError
+        # Nested atomic() keeps the per-test transaction usable after the failure
+        with self.assertRaises(Exception), transaction.atomic():
             ClubStaff.objects.create(
                 club=self.club,
                 user=self.user_profile2,
@@ -1057,6 +1179,10 @@ class ClubStaffOrganizationUserTestCase(TestCase):
                 role="assistant",
             )
 
+
+class ClubStaffGetOrganizationUserTestCase(ClubStaffOrganizationUserTestBase):
+    """ClubStaff.get_organization_user helper"""
+
     def test_get_organization_user_method(self):
         """Test get_organization_user helper method"""
         # Create additional user to avoid unique constraint violation
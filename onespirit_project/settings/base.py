@@ -6,6 +6,7 @@ Environment-specific settings are in dev.py and prod.py.
 """
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -115,3 +116,21 @@ MEDIA_ROOT = BASE_DIR / 'media'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Tenant-specific settings container
+# Environment settings instantiate this as TENANT_SETTINGS; consumers use
+# attribute access (settings.TENANT_SETTINGS.TENANT_CACHE_TIMEOUT).
+@dataclass(frozen=True, slots=True)
+class TenantConfig:
+    # Enable tenant isolation debugging
+    DEBUG_TENANT_ISOLATION: bool = False
+
+    # Cache timeout for tenant lookups (in seconds)
+    TENANT_CACHE_TIMEOUT: int = 300
+
+    # Maximum number of cached tenant entries
+    TENANT_CACHE_MAX_ENTRIES: int = 100
+
+    # Enable tenant access control middleware
+    ENABLE_TENANT_ACCESS_CONTROL: bool = True
@@ -4,6 +4,8 @@ Development settings for onespirit_project.
 This file contains settings specific to development environment.
 """
 
+import os
+
 from .base import *
 
 # SECURITY WARNING: don't run with debug turned on in production!
@@ -35,16 +37,28 @@ DATABASES = {
 
 
 # Caching configuration for tenant management
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'onespirit-cache',
-        'TIMEOUT': 300,  # 5 minutes default
-        'OPTIONS': {
-            'MAX_ENTRIES': 1000,
+# Use Redis when REDIS_URL is set so dev matches prod cache behaviour; otherwise
+# fall back to the in-process LocMemCache (no external service required).
+_redis_url = os.getenv('REDIS_URL', '')
+if _redis_url:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': _redis_url,
+            'TIMEOUT': 300,  # 5 minutes default
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'onespirit-cache',
+            'TIMEOUT': 300,  # 5 minutes default
+            'OPTIONS': {
+                'MAX_ENTRIES': 1000,
+            }
         }
     }
-}
 
 
 # Logging configuration for tenant debugging
@@ -79,16 +93,16 @@ LOGGING = {
 
 
 # Tenant-specific settings
-TENANT_SETTINGS = {
+TENANT_SETTINGS = TenantConfig(
     # Enable tenant isolation debugging in development
-    'DEBUG_TENANT_ISOLATION': DEBUG,
+    DEBUG_TENANT_ISOLATION=DEBUG,
 
     # Cache timeout for tenant lookups (in seconds)
-    'TENANT_CACHE_TIMEOUT': 300,
+    TENANT_CACHE_TIMEOUT=300,
 
     # Maximum number of cached tenant entries
-    'TENANT_CACHE_MAX_ENTRIES': 100,
+    TENANT_CACHE_MAX_ENTRIES=100,
 
     # Enable tenant access control middleware
-    'ENABLE_TENANT_ACCESS_CONTROL': True,
-}
+    ENABLE_TENANT_ACCESS_CONTROL=True,
+)
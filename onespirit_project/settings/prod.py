@@ -6,6 +6,7 @@ This file contains settings specific to production environment.
 
 from .base import *
 from pathlib import Path
+import functools
 import os
 
 # SECURITY WARNING: don't run with debug turned on in production!
@@ -16,27 +17,25 @@ _raw_hosts = os.getenv('ALLOWED_HOSTS', '')
 ALLOWED_HOSTS = [h.strip() for h in _raw_hosts.split(',') if h.strip()]
 
 def _build_csrf_trusted(origins_hosts: list[str]) -> list[str]:
-    origins: list[str] = []
-    for h in origins_hosts:
-        host = h.strip()
-        if not host:
-            continue
-        if host.startswith('*.'):
-            # Allow all subdomains
-            origins.append(f"https://{host}")
-        else:
-            origins.append(f"https://{host}")
-    return origins
+    # dict.fromkeys dedupes while preserving ALLOWED_HOSTS order; wildcard
+    # hosts (e.g. '*.example.com') map to the same https:// form.
+    return list(dict.fromkeys(
+        f"https://{h.strip()}" for h in origins_hosts if h.strip()
+    ))
 
 
+@functools.lru_cache(maxsize=8)
 def _read_secret_file(var_name: str) -> str | None:
-    """Read a secret value from file pointed by env var (e.g., SECRET_KEY_FILE)."""
+    """Read a secret value from file pointed by env var (e.g., SECRET_KEY_FILE).
+
+    Results are memoized; call ``_read_secret_file.cache_clear()`` after rotating secrets.
+    """
     path = os.getenv(var_name)
     if path and os.path.isfile(path):
         try:
             with open(path, 'r', encoding='utf-8') as f:
                 return f.read().strip()
-        except Exception:
+        except OSError:
             return None
     return None
 
@@ -125,20 +124,27 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'verbose',
         },
+        # Loggers only enqueue records; a QueueListener (started in
+        # AccountsConfig.ready) drains them to file/console off the request thread.
+        'queue': {
+            'class': 'logging.handlers.QueueHandler',
+            'handlers': ['file', 'console'],
+            'respect_handler_level': True,
+        },
     },
     'loggers': {
         'django': {
-            'handlers': ['file', 'console'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': False,
         },
         'accounts.middleware': {
-            'handlers': ['file', 'console'],
+            'handlers': ['queue'],
             'level': 'WARNING',
             'propagate': True,
         },
         'accounts.managers': {
-            'handlers': ['file', 'console'],
+            'handlers': ['queue'],
             'level': 'INFO',
             'propagate': True,
         },
@@ -154,16 +160,16 @@ MEDIA_ROOT = Path('/app/media')
 
 
 # Tenant-specific settings
-TENANT_SETTINGS = {
+TENANT_SETTINGS = TenantConfig(
     # Disable tenant isolation debugging in production
-    'DEBUG_TENANT_ISOLATION': False,
+    DEBUG_TENANT_ISOLATION=False,
 
     # Cache timeout for tenant lookups (in seconds)
-    'TENANT_CACHE_TIMEOUT': 600,  # 10 minutes in production
+    TENANT_CACHE_TIMEOUT=600,  # 10 minutes in production
 
     # Maximum number of cached tenant entries
-    'TENANT_CACHE_MAX_ENTRIES': 1000,
+    TENANT_CACHE_MAX_ENTRIES=1000,
 
     # Enable tenant access control middleware
-    'ENABLE_TENANT_ACCESS_CONTROL': True,
-}
+    ENABLE_TENANT_ACCESS_CONTROL=True,
+)
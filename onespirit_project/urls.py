@@ -16,11 +16,11 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from django.http import JsonResponse
-from django.db import connection
-from django.core.cache import cache
 from django.conf import settings
-from django.conf.urls.static import static
+
+
+# Static body for the healthy path; only the unhealthy response varies per call
+_HEALTHY_BODY = b'{"status": "healthy", "checks": {"database": "connected", "cache": "connected"}}'
 
 
 def health_view(_request):
@@ -29,37 +29,37 @@ def health_view(_request):
     Verifies critical runtime dependencies: database and cache.
     Returns 200 if healthy, 503 if any component fails.
     """
-    health_status = {
-        "status": "healthy",
-        "checks": {}
-    }
+    from django.core.cache import cache
+    from django.db import connection
+    from django.http import HttpResponse, JsonResponse
+
+    checks = {}
     is_healthy = True
 
     # Check database connectivity
     try:
         connection.ensure_connection()
-        health_status["checks"]["database"] = "connected"
+        checks["database"] = "connected"
     except Exception as e:
-        health_status["checks"]["database"] = f"failed: {str(e)}"
+        checks["database"] = f"failed: {str(e)}"
         is_healthy = False
 
     # Check cache (Redis) connectivity
     try:
         cache.set("health_check", "ok", timeout=10)
         if cache.get("health_check") == "ok":
-            health_status["checks"]["cache"] = "connected"
+            checks["cache"] = "connected"
         else:
-            health_status["checks"]["cache"] = "failed: unable to read"
+            checks["cache"] = "failed: unable to read"
             is_healthy = False
     except Exception as e:
-        health_status["checks"]["cache"] = f"failed: {str(e)}"
+        checks["cache"] = f"failed: {str(e)}"
         is_healthy = False
 
-    if not is_healthy:
-        health_status["status"] = "unhealthy"
-        return JsonResponse(health_status, status=503)
-    
-    return JsonResponse(health_status)
+    if is_healthy:
+        return HttpResponse(_HEALTHY_BODY, content_type="application/json")
+
+    return JsonResponse({"status": "unhealthy", "checks": checks}, status=503)
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -70,4 +70,6 @@ urlpatterns = [
 # Serve media files in development
 # In production, nginx serves these directly from the volume mount
 if settings.DEBUG:
+    from django.conf.urls.static import static
+
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -7,7 +7,7 @@ class ContactAdmin(admin.ModelAdmin):
     list_display = ['first_name', 'last_name', 'email', 'mobile_number', 'created_at', 'is_active']
     list_filter = ['created_at', 'is_active']
     search_fields = ['first_name', 'last_name', 'email']
-    ordering = ['last_name', 'first_name']
+    ordering = ['sort_name']
     readonly_fields = ['created_at', 'updated_at']
     
     fieldsets = (
@@ -30,6 +30,7 @@ class ContactAdmin(admin.ModelAdmin):
 @admin.register(UserProfile)  
 class UserProfileAdmin(admin.ModelAdmin):
     list_display = ['contact', 'user', 'is_system_admin', 'is_club_owner_display']
+    list_select_related = ['contact', 'user']
     list_filter = ['is_system_admin', 'can_create_clubs', 'can_manage_members']
     search_fields = ['contact__first_name', 'contact__last_name', 'user__username']
     readonly_fields = ['is_club_owner_display', 'created_at', 'updated_at', 'last_login_attempt']
@@ -50,6 +51,6 @@ class UserProfileAdmin(admin.ModelAdmin):
 
     def is_club_owner_display(self, obj):
         """Display method for is_club_owner in admin."""
-        return obj.is_club_owner()
+        return obj.club_permissions_summary.is_club_owner
     is_club_owner_display.short_description = 'Is Club Owner'
     is_club_owner_display.boolean = True
@@ -0,0 +1,58 @@
+"""
+Custom managers for the people app.
+"""
+
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+from datetime import date
+
+from django.db.models import Case, ExpressionWrapper, IntegerField, Q, Value, When
+from django.db.models.functions import ExtractYear
+from django.utils import timezone
+
+from accounts.managers import OrganizationAwareManager
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from people.models import Contact
+
+
+class ContactManager(OrganizationAwareManager):
+    """
+    Organization-aware manager for Contact with list and age helpers.
+    """
+
+    def brief(self) -> QuerySet[Contact]:
+        """
+        Get contacts with only the columns needed to list them.
+
+        Returns:
+            QuerySet deferring wide fields such as address and medical_conditions
+        """
+        return self.get_queryset().only(
+            "first_name", "last_name", "email", "is_active", "tenant", "organization"
+        )
+
+    def with_age(self, today: Optional[date] = None) -> QuerySet[Contact]:
+        """
+        Annotate contacts with their age computed in the database.
+
+        Args:
+            today: Reference date for the calculation (default: today)
+
+        Returns:
+            QuerySet of Contact instances with an ``age`` annotation
+        """
+        today = today or timezone.now().date()
+        # Subtract one year when this year's birthday is still ahead
+        birthday_pending = Q(date_of_birth__month__gt=today.month) | Q(
+            date_of_birth__month=today.month, date_of_birth__day__gt=today.day
+        )
+        return self.get_queryset().annotate(
+            age=ExpressionWrapper(
+                Value(today.year)
+                - ExtractYear("date_of_birth")
+                - Case(When(birthday_pending, then=Value(1)), default=Value(0)),
+                output_field=IntegerField(),
+            )
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-16 05:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0010_remove_userprofile_people_loginuser_owner_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='userprofile',
+            name='people_userprofile_admin_idx',
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(condition=models.Q(('is_system_admin', True)), fields=['user'], name='people_userprofile_admin_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.5 on 2026-10-16 06:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_fix_tenantaccountcontact_index_field_reference'),
+        ('organizations', '0006_alter_organization_slug'),
+        ('people', '0011_userprofile_admin_partial_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='people_contact_tenant_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='people_contact_org_idx',
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='email',
+            field=models.EmailField(help_text='Email address (must be unique per tenant)', max_length=254),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='organization',
+            field=models.ForeignKey(blank=True, db_index=False, help_text='Direct organization membership', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='people_contacts', to='organizations.organization'),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='tenant',
+            field=models.ForeignKey(blank=True, db_index=False, help_text='Tenant that owns this contact', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='people_contacts', to='accounts.tenantaccount'),
+        ),
+    ]
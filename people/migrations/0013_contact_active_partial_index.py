@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-16 06:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0012_drop_redundant_contact_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='people_contact_active_idx',
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['is_active'], name='people_contact_active_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-16 06:11
+
+import people.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0013_contact_active_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='contact',
+            constraint=models.CheckConstraint(condition=models.Q(('date_of_birth__lt', people.models.CurrentDate())), name='people_contact_dob_past', violation_error_message='Date of birth must be in the past'),
+        ),
+    ]
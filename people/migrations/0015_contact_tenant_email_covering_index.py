@@ -0,0 +1,43 @@
+# Generated by Django 5.2.5 on 2026-10-16 06:17
+
+from django.db import migrations, models
+
+COVERING_INDEX = models.Index(
+    fields=['tenant', 'email'],
+    include=['first_name', 'last_name', 'is_active', 'organization'],
+    name='people_contact_t_email_cov_idx',
+)
+
+
+def create_covering_index(apps, schema_editor):
+    # Without INCLUDE support the index would only repeat the unique
+    # (tenant, email) index, so it is only created where INCLUDE works
+    if schema_editor.connection.features.supports_covering_indexes:
+        schema_editor.add_index(apps.get_model('people', 'Contact'), COVERING_INDEX)
+
+
+def drop_covering_index(apps, schema_editor):
+    if schema_editor.connection.features.supports_covering_indexes:
+        schema_editor.remove_index(apps.get_model('people', 'Contact'), COVERING_INDEX)
+
+
+class Migration(migrations.Migration):
+    """
+    Covering index for tenant+email lookups that read names and status.
+
+    It is created with RunPython rather than declared on Contact.Meta, so
+    backends without covering index support (SQLite in development) skip it
+    instead of creating a plain duplicate of the unique (tenant, email) index.
+    """
+
+    dependencies = [
+        ('people', '0014_contact_dob_past_constraint'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='people_contact_t_email_idx',
+        ),
+        migrations.RunPython(create_covering_index, drop_covering_index),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.5 on 2026-10-16 06:39
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0015_contact_tenant_email_covering_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='contact',
+            options={'ordering': ['sort_name'], 'verbose_name': 'Contact', 'verbose_name_plural': 'Contacts'},
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='sort_name',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('last_name', models.Value(' '), 'first_name'), output_field=models.CharField(max_length=101)),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['sort_name'], name='people_contact_sort_name_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.5 on 2026-10-16 07:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Partial index for the "admin of another organization" EXISTS checks in
+    people.signals. OrganizationUser belongs to django-organizations, so the
+    index is created here with raw SQL rather than on the model's Meta.
+    """
+
+    dependencies = [
+        ('organizations', '0006_alter_organization_slug'),
+        ('people', '0017_contact_tenant_active_partial_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                'CREATE INDEX IF NOT EXISTS orguser_user_isadmin_idx '
+                'ON organizations_organizationuser (user_id) WHERE is_admin'
+            ),
+            reverse_sql='DROP INDEX IF EXISTS orguser_user_isadmin_idx',
+        ),
+    ]
@@ -1,27 +1,56 @@
 from __future__ import annotations
 
+import functools
+from collections import namedtuple
+from datetime import date
 from typing import TYPE_CHECKING, Any, Optional
 
+from django.apps import apps
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Count, Exists, OuterRef, Q
+from django.db.models.functions import Concat
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.functional import SimpleLazyObject, cached_property
+from organizations.models import Organization, OrganizationOwner, OrganizationUser
 
-from accounts.managers import OrganizationAwareManager, TenantAwareManager
+from accounts.managers import TenantAwareManager
 
-if TYPE_CHECKING:
-    from typing import List
+from .managers import ContactManager
 
-    from organizations.models import Organization
+if TYPE_CHECKING:
+    from typing import Iterable, List
 
     from accounts.models import TenantAccount
 
 # Import signals to register them
 
 
+# Lightweight, immutable summary returned by UserProfile.club_permissions_summary
+ClubPermsSummary = namedtuple(
+    "ClubPermsSummary", "is_admin can_create_clubs can_manage_members is_club_owner"
+)
+
+# UserProfile fields that feed UserProfile._sync_user()
+_USER_SYNC_FIELDS = frozenset({"user", "contact", "is_system_admin"})
+
+@functools.cache
+def _clubs_model(model_name: str) -> type[models.Model]:
+    """Resolve a clubs model once (clubs.models imports this module indirectly)"""
+    return apps.get_model("clubs", model_name)
+
+
+class CurrentDate(models.Func):
+    """SQL CURRENT_DATE (unlike Now(), SQLite allows it in CHECK constraints)"""
+
+    template = "CURRENT_DATE"
+    output_field = models.DateField()
+
+
 class Contact(models.Model):
     """Contact model for personal information relating to a person"""
 
@@ -39,8 +68,13 @@ class Contact(models.Model):
     mobile_number = models.CharField(
         max_length=20, help_text="Primary mobile phone number"
     )
-    email = models.EmailField(
-        db_index=True, help_text="Email address (must be unique per tenant)"
+    email = models.EmailField(help_text="Email address (must be unique per tenant)")
+
+    # Database-generated "Last First" sort key, used for ordering and search
+    sort_name = models.GeneratedField(
+        expression=Concat("last_name", models.Value(" "), "first_name"),
+        output_field=models.CharField(max_length=101),
+        db_persist=True,
     )
 
     # TODO move Emergency Contact Information and Medical Information to ClubMember model
@@ -74,6 +108,7 @@ class Contact(models.Model):
         help_text="Tenant that owns this contact",
         null=True,  # Temporarily nullable for migration
         blank=True,
+        db_index=False,  # Covered by the leading column of (tenant, email)
     )
 
     # Organization relationship for direct organization membership
@@ -84,6 +119,7 @@ class Contact(models.Model):
         blank=True,
         related_name="people_contacts",
         help_text="Direct organization membership",
+        db_index=False,  # Covered by the leading column of (organization, email)
     )
 
     # Metadata Fields for auditing and soft delete
@@ -92,47 +128,70 @@ class Contact(models.Model):
     is_active = models.BooleanField(default=True, help_text="Soft delete flag")
 
     # Organization and tenant-aware managers
-    objects = OrganizationAwareManager()  # Default manager with dual filtering
+    objects = ContactManager()  # Default manager with dual filtering
     all_objects = models.Manager()  # Bypass all filtering when needed
     tenant_objects = (
         TenantAwareManager()
     )  # Tenant-only filtering for legacy compatibility
 
     class Meta:
-        ordering = ["last_name", "first_name"]
+        ordering = ["sort_name"]
         verbose_name = "Contact"
         verbose_name_plural = "Contacts"
         indexes = [
             models.Index(
                 fields=["last_name", "first_name"], name="people_contact_name_idx"
             ),
+            models.Index(fields=["sort_name"], name="people_contact_sort_name_idx"),
             models.Index(fields=["email"], name="people_contact_email_idx"),
-            models.Index(fields=["tenant"], name="people_contact_tenant_idx"),
-            models.Index(fields=["tenant", "email"], name="people_contact_t_email_idx"),
-            models.Index(fields=["organization"], name="people_contact_org_idx"),
+            # The tenant+email covering index (INCLUDE names/status) is
+            # created in migration 0015, only on backends that support it
             models.Index(
                 fields=["organization", "email"], name="people_contact_org_email_idx"
             ),
-            models.Index(fields=["is_active"], name="people_contact_active_idx"),
+            # Partial index: tenant-scoped listing of active contacts only
+            models.Index(
+                fields=["tenant", "id"],
+                name="people_contact_active_partial",
+                condition=models.Q(is_active=True),
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
                 fields=["tenant", "email"], name="people_contact_tenant_email_unique"
             ),
+            models.CheckConstraint(
+                condition=models.Q(date_of_birth__lt=CurrentDate()),
+                name="people_contact_dob_past",
+                violation_error_message="Date of birth must be in the past",
+            ),
         ]
 
     def __str__(self) -> str:
         return f"{self.first_name} {self.last_name}"
 
     def get_full_name(self) -> str:
-        """Return formatted full name"""
-        return f"{self.first_name} {self.last_name}".strip()
-
-    def get_age(self) -> Optional[int]:
-        """Calculate current age from date of birth"""
+        """Return formatted full name (names are stripped in clean())"""
+        return self.first_name + " " + self.last_name
+
+    @classmethod
+    def list_queryset(cls) -> models.QuerySet[Contact]:
+        """Return contacts with only the columns needed for list display"""
+        return cls.objects.brief()
+
+    @classmethod
+    def bulk_import(
+        cls, objs: Iterable[Contact], batch_size: int = 1000
+    ) -> List[Contact]:
+        """Insert contacts in batches within a single transaction"""
+        with transaction.atomic():
+            return cls.all_objects.bulk_create(objs, batch_size=batch_size)
+
+    def get_age(self, today: Optional[date] = None) -> Optional[int]:
+        """Calculate age from date of birth (pass ``today`` when looping)"""
         if not self.date_of_birth:
             return None
-        today = timezone.now().date()
+        today = today or timezone.now().date()
         age = today.year - self.date_of_birth.year
         if today.month < self.date_of_birth.month or (
             today.month == self.date_of_birth.month
@@ -141,14 +200,24 @@ class Contact(models.Model):
             age -= 1
         return age
 
+    @cached_property
+    def age(self) -> Optional[int]:
+        """Current age (computed once per instance, reset on save())"""
+        return self.get_age()
+
     def get_absolute_url(self) -> str:
         """Return URL for contact detail view"""
         return reverse("people:contact_detail", kwargs={"pk": self.pk})
 
     def clean(self) -> None:
         """Custom validation"""
+        # Normalize names once here rather than on every get_full_name() call
+        self.first_name = self.first_name.strip()
+        self.last_name = self.last_name.strip()
 
-        # Validate date of birth is in the past
+        # Validate date of birth is in the past. The people_contact_dob_past
+        # constraint enforces the same rule in the database; checking it here
+        # keys the error to the field for forms and the admin
         if self.date_of_birth and self.date_of_birth >= timezone.now().date():
             raise ValidationError(
                 {"date_of_birth": "Date of birth must be in the past"}
@@ -158,22 +227,42 @@ class Contact(models.Model):
         if self.email and not self.email.strip():
             raise ValidationError({"email": "Email address cannot be empty"})
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Override save to drop the cached age (date_of_birth may change)"""
+        self.__dict__.pop("age", None)
+        super().save(*args, **kwargs)
+
     def get_organization(self) -> Optional[Organization]:
         """Get primary organization for contact"""
         return self.organization
 
     def can_access_organization(self, organization: Organization) -> bool:
         """Check if contact can access organization"""
-        return self.organization == organization
+        # Compare keys so an unloaded FK is not fetched just for __eq__
+        return self.organization_id == getattr(organization, "pk", None)
 
     def get_all_organizations(self) -> List[Organization]:
         """Get all organizations contact has access to"""
         orgs = []
-        if self.organization:
+        if self.organization_id:
             orgs.append(self.organization)
         return orgs
 
 
+class UserProfileQuerySet(models.QuerySet):
+    """QuerySet for UserProfile with common eager-loading helpers"""
+
+    def with_context(self) -> UserProfileQuerySet:
+        """Join the contact (with its tenant and organization) and the user"""
+        return self.select_related(
+            "contact__tenant", "contact__organization", "user"
+        )
+
+    def with_club_assignments(self) -> UserProfileQuerySet:
+        """Prefetch club_assignments so ownership checks are answered in Python"""
+        return self.prefetch_related("club_assignments")
+
+
 class UserProfile(models.Model):
     """UserProfile model for contacts that can login and manage club membership"""
 
@@ -209,17 +298,121 @@ class UserProfile(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     last_login_attempt = models.DateTimeField(null=True, blank=True)
 
+    objects = UserProfileQuerySet.as_manager()
+
     class Meta:
         verbose_name = "User Profile"
         verbose_name_plural = "User Profiles"
         indexes = [
+            # Partial index: only the (few) system admins are indexed, keyed
+            # by user for admin lookups of a given user
             models.Index(
-                fields=["is_system_admin"], name="people_userprofile_admin_idx"
+                fields=["user"],
+                name="people_userprofile_admin_idx",
+                condition=models.Q(is_system_admin=True),
             ),
         ]
 
     def __str__(self) -> str:
-        return f"{self.contact.get_full_name()} (User Profile)"
+        contact = self.contact
+        return f"{contact.first_name} {contact.last_name} (User Profile)"
+
+    @classmethod
+    def list_queryset(cls) -> models.QuerySet[UserProfile]:
+        """Return profiles with only the contact columns __str__ needs (no N+1)"""
+        return cls.objects.select_related("contact").only(
+            "contact", "contact__first_name", "contact__last_name"
+        )
+
+    @classmethod
+    def bulk_import(
+        cls, objs: Iterable[UserProfile], batch_size: int = 1000
+    ) -> List[UserProfile]:
+        """Insert profiles in batches and sync their Users' flags in bulk"""
+        with transaction.atomic():
+            profiles = cls.objects.bulk_create(objs, batch_size=batch_size)
+            # bulk_create skips save(), so sync the Users in bulk instead
+            cls.bulk_sync_users(profiles, batch_size=batch_size)
+        return profiles
+
+    @classmethod
+    def bulk_sync_users(
+        cls, profiles: Iterable[UserProfile], batch_size: int = 1000
+    ) -> None:
+        """Apply _sync_user() to many profiles with a few UPDATEs per batch"""
+        user_ids = [profile.user_id for profile in profiles]
+        for start in range(0, len(user_ids), batch_size):
+            users = User.objects.filter(pk__in=user_ids[start : start + batch_size])
+            users.filter(profile__contact__is_active=False, is_active=True).update(
+                is_active=False
+            )
+            users.filter(profile__contact__is_active=True, is_active=False).update(
+                is_active=True
+            )
+            users.filter(
+                models.Q(profile__is_system_admin=True)
+                | models.Q(profile__club_assignments__role="owner"),
+                is_staff=False,
+            ).update(is_staff=True)
+
+    @classmethod
+    def bulk_sync_organization_admins(
+        cls, organization_users: Iterable[OrganizationUser], batch_size: int = 1000
+    ) -> None:
+        """
+        Sync is_system_admin for many OrganizationUser.is_admin changes.
+
+        For memberships saved with bulk_update(), which sends no post_save.
+        As in people.signals, only memberships whose is_admin differs from
+        the value they were loaded with are synced: their users are promoted
+        (and made staff), or demoted unless they still admin another
+        organization. Other system admins, such as ones set by hand, are
+        left alone. Profiles memoized on the memberships' users are updated.
+        """
+        changed = [
+            org_user
+            for org_user in organization_users
+            if org_user.__dict__.get("_synced_is_admin", not org_user.is_admin)
+            != org_user.is_admin
+        ]
+        is_org_admin = Exists(
+            OrganizationUser.objects.filter(user=OuterRef("user"), is_admin=True)
+        )
+        for start in range(0, len(changed), batch_size):
+            batch = changed[start : start + batch_size]
+            promoted_ids = [org_user.user_id for org_user in batch if org_user.is_admin]
+            demoted_ids = [
+                org_user.user_id for org_user in batch if not org_user.is_admin
+            ]
+            if promoted_ids:
+                cls.objects.filter(
+                    user_id__in=promoted_ids, is_system_admin=False
+                ).update(is_system_admin=True)
+                # Promotion grants staff status, as save() would have
+                User.objects.filter(
+                    pk__in=promoted_ids, profile__is_system_admin=True, is_staff=False
+                ).update(is_staff=True)
+            if demoted_ids:
+                cls.objects.filter(
+                    user_id__in=demoted_ids, is_system_admin=True
+                ).exclude(is_org_admin).update(is_system_admin=False)
+
+            is_admin_by_user = dict(
+                cls.objects.filter(
+                    user_id__in=promoted_ids + demoted_ids
+                ).values_list("user_id", "is_system_admin")
+            )
+            for org_user in batch:
+                org_user._synced_is_admin = org_user.is_admin
+                if not OrganizationUser.user.is_cached(org_user):
+                    continue
+                profile = User.profile.related.get_cached_value(
+                    org_user.user, default=None
+                )
+                if profile is not None and profile.user_id in is_admin_by_user:
+                    profile.is_system_admin = is_admin_by_user[profile.user_id]
+                    profile.__dict__.pop("_org_roles", None)
+                    profile.__dict__.pop("club_permissions_summary", None)
 
     def is_club_owner(self, club=None) -> bool:
         """
@@ -233,21 +426,37 @@ class UserProfile(models.Model):
             True if the user has club_assignments where role="owner",
             regardless of is_active status.
         """
-        if not hasattr(self, "club_assignments"):
+        # club_assignments always exists (related_name); an unsaved profile
+        # simply has none, so answer without touching the relation
+        if self.pk is None:
             return False
 
-        # Use optimized query with select_related for single club check
-        queryset = self.club_assignments.select_related("club").filter(role="owner")
+        if club is None:
+            return self._is_owner_of_any
 
-        if club is not None:
-            # Handle both real Club objects and mock objects
-            if hasattr(club, "pk") and club.pk is not None:
-                queryset = queryset.filter(club=club)
-            else:
-                # Mock object without pk - can't query database
-                return False
+        # Handle both real Club objects and mock objects
+        if hasattr(club, "pk") and club.pk is not None:
+            assignments = self._prefetched_club_assignments()
+            if assignments is not None:
+                return any(
+                    a.role == "owner" and a.club_id == club.pk for a in assignments
+                )
+            return self.club_assignments.filter(role="owner", club=club).exists()
 
-        return queryset.exists()
+        # Mock object without pk - can't query database
+        return False
+
+    @cached_property
+    def _is_owner_of_any(self) -> bool:
+        """Whether user owns any club (cached until the next save())"""
+        assignments = self._prefetched_club_assignments()
+        if assignments is not None:
+            return any(a.role == "owner" for a in assignments)
+        return self.club_assignments.filter(role="owner").exists()
+
+    def _prefetched_club_assignments(self) -> Optional[list]:
+        """Return club_assignments if prefetched (see with_club_assignments())"""
+        return getattr(self, "_prefetched_objects_cache", {}).get("club_assignments")
 
     def has_club_permissions(self) -> bool:
         """Check if user has any club management permissions"""
@@ -262,8 +471,11 @@ class UserProfile(models.Model):
         if not club:
             return self.has_club_permissions()
 
-        # Check if club belongs to same tenant
-        if hasattr(club, "tenant") and club.tenant != self.contact.tenant:
+        # Check if club belongs to same tenant (compare IDs to avoid FK fetches)
+        if hasattr(club, "tenant_id"):
+            if club.tenant_id != self.tenant_id:
+                return False
+        elif hasattr(club, "tenant") and getattr(club.tenant, "pk", None) != self.tenant_id:
             return False
 
         # Check if user has organization-level permissions over club's organization
@@ -283,154 +495,235 @@ class UserProfile(models.Model):
         System admins manage all clubs in their tenant; regular users manage clubs
         where they have active staff assignments.
         """
-        from clubs.models import Club
+
+        Club, ClubStaff = _clubs_model("Club"), _clubs_model("ClubStaff")
 
         # System admins can manage all clubs in their tenant
         if self.is_system_admin:
-            return Club.objects.select_related("tenant", "organization").filter(
-                tenant=self.contact.tenant
+            return Club.objects.select_related("tenant").filter(
+                tenant_id=self.tenant_id
             )
 
-        # Regular users: clubs where they have active staff assignments
-        return (
-            Club.objects.select_related("tenant", "organization")
-            .filter(staff_assignments__user=self, staff_assignments__is_active=True)
-            .distinct()
+        # Regular users: clubs where they have active staff assignments.
+        # EXISTS (semi-join) avoids the join + DISTINCT over wide Club rows.
+        # Club *is* the Organization (multi-table inheritance), so only the
+        # tenant FK needs select_related.
+        active_assignments = ClubStaff.all_objects.filter(
+            club=OuterRef("pk"), user=self, is_active=True
+        )
+        return Club.objects.select_related("tenant").filter(Exists(active_assignments))
+
+    @cached_property
+    def club_permissions_summary(self) -> ClubPermsSummary:
+        """Flat club permission flags (cached for the instance lifetime)"""
+        return ClubPermsSummary(
+            self.is_system_admin,
+            self.can_create_clubs,
+            self.can_manage_members,
+            self.is_club_owner(),
         )
 
-    def get_club_permissions_summary(self) -> dict:
-        """Return a summary of the user's club-related permissions."""
-        return {
-            "is_admin": self.is_system_admin,
-            "can_create_clubs": self.can_create_clubs,
-            "can_manage_members": self.can_manage_members,
-            "is_club_owner": self.is_club_owner(),
-        }
+    def _fetch_org_role(self, organization: Organization) -> Optional[dict]:
+        """
+        Get this user's membership flags for organization in one query.
+
+        Returns:
+            Dict with ``is_admin`` and ``is_owner`` keys, or None when the user
+            has no OrganizationUser row. Cached for this instance's lifetime
+            only (cleared by save() and refresh_from_db()); membership
+            changes made elsewhere are not seen until then.
+        """
+        org_roles = self.__dict__.setdefault("_org_roles", {})
+        if organization.pk not in org_roles:
+            # Served by OrganizationUser's unique (user, organization) index
+            org_roles[organization.pk] = (
+                OrganizationUser.objects.filter(
+                    user_id=self.user_id, organization_id=organization.pk
+                )
+                .annotate(
+                    is_owner=Exists(
+                        OrganizationOwner.objects.filter(
+                            organization_user=OuterRef("pk")
+                        )
+                    )
+                )
+                .values("is_admin", "is_owner")
+                .first()
+            )
+        return org_roles[organization.pk]
 
     def can_access_organization(self, organization: Organization) -> bool:
         """Check if user can access organization"""
-        user = self.user
 
-        # Check django-organizations membership (any level)
-        if organization.is_admin(user) or organization.is_owner(user):
-            return True
-
-        # Check for regular organization membership
-        from organizations.models import OrganizationUser
-
-        if OrganizationUser.objects.filter(
-            user=user, organization=organization
-        ).exists():
+        # Check django-organizations membership (any level). Admins and owners
+        # always have an OrganizationUser row.
+        if self._fetch_org_role(organization) is not None:
             return True
 
         # Check direct organization membership through Contact
-        return self.contact.organization == organization
+        return self.contact.organization_id == organization.pk
 
     def is_organization_admin(self, organization: Organization) -> bool:
         """Check if user is organization admin"""
-        return organization.is_admin(self.user)
+        org_role = self._fetch_org_role(organization)
+        return org_role is not None and org_role["is_admin"]
 
     def is_organization_owner(self, organization: Organization) -> bool:
         """Check if user is organization owner"""
-        return organization.is_owner(self.user)
+        org_role = self._fetch_org_role(organization)
+        return org_role is not None and org_role["is_owner"]
 
     def get_organizations(self) -> List[Organization]:
         """Get all organizations user belongs to with optimized query"""
-        from organizations.models import OrganizationUser
 
-        user = self.user
-        # Use select_related to avoid N+1 queries
-        org_users = OrganizationUser.objects.select_related("organization").filter(
-            user=user
+        # Query organizations directly through the membership join (single query)
+        organizations = list(
+            Organization.objects.filter(organization_users__user_id=self.user_id)
         )
-        organizations = [org_user.organization for org_user in org_users]
 
         # Also include direct organization membership through Contact
-        if self.contact.organization and self.contact.organization not in organizations:
+        contact_org_id = self.contact.organization_id
+        if contact_org_id and contact_org_id not in {org.pk for org in organizations}:
             organizations.append(self.contact.organization)
 
         return organizations
 
+    def get_organization_ids(self) -> List[int]:
+        """Get IDs of all organizations user belongs to (no model instances)"""
+
+        org_ids = list(
+            OrganizationUser.objects.filter(user_id=self.user_id).values_list(
+                "organization_id", flat=True
+            )
+        )
+
+        # Also include direct organization membership through Contact
+        contact_org_id = self.contact.organization_id
+        if contact_org_id and contact_org_id not in org_ids:
+            org_ids.append(contact_org_id)
+
+        return org_ids
+
+    def get_organization_pairs(self) -> List[tuple[int, str]]:
+        """Get (id, name) of all organizations user belongs to, for display"""
+
+        pairs = list(
+            OrganizationUser.objects.filter(user_id=self.user_id).values_list(
+                "organization_id", "organization__name"
+            )
+        )
+
+        # Also include direct organization membership through Contact
+        contact_org_id = self.contact.organization_id
+        if contact_org_id and contact_org_id not in {org_id for org_id, _ in pairs}:
+            pairs.extend(
+                Organization.objects.filter(pk=contact_org_id).values_list("pk", "name")
+            )
+
+        return pairs
+
     def get_organization_permission_level(
         self, organization: Organization
     ) -> Optional[str]:
         """Get permission level within organization"""
-        if organization.is_owner(self.user):
-            return "owner"
-        elif organization.is_admin(self.user):
-            return "admin"
-        elif self.contact.organization == organization:
+
+        org_user = self._fetch_org_role(organization)
+        if org_user is not None:
+            if org_user["is_owner"]:
+                return "owner"
+            if org_user["is_admin"]:
+                return "admin"
             return "member"
-        else:
-            # Check for regular organization membership via OrganizationUser
-            from organizations.models import OrganizationUser
-
-            if OrganizationUser.objects.filter(
-                user=self.user, organization=organization
-            ).exists():
-                return "member"
-            return None
+        if self.contact.organization_id == organization.pk:
+            return "member"
+        return None
 
-    def get_club_permissions_summary(self) -> dict:
+    def get_club_permissions_counts(self) -> dict:
         """
-        Get comprehensive summary of user's club permissions with optimized queries.
+        Count the user's clubs by role in a single aggregate query.
 
         Returns:
-            Dictionary containing permission summary with pre-fetched data
+            Dictionary with owned_count, managed_count and all_count
         """
-        # Safe runtime import - no circular dependency risk
-        from clubs.models import Club
-
-        if not hasattr(self, "contact") or not self.contact:
-            return {
-                "is_admin": self.is_system_admin,
-                "owned_clubs": [],
-                "managed_clubs": [],
-                "all_clubs": [],
-                "can_create_clubs": self.can_create_clubs,
-                "can_manage_members": self.can_manage_members,
-            }
-
-        # Get all clubs with staff assignments in one optimized query
-        clubs_with_assignments = (
-            Club.objects.select_related("tenant", "organization")
-            .prefetch_related("staff_assignments")
-            .filter(staff_assignments__user=self, staff_assignments__is_active=True)
-            .distinct()
+        Club, ClubStaff = _clubs_model("Club"), _clubs_model("ClubStaff")
+
+        if not self.contact_id:
+            return {"owned_count": 0, "managed_count": 0, "all_count": 0}
+
+        # Same tenant scoping as the clubs loaded by get_club_permissions_lists()
+        return ClubStaff.all_objects.filter(
+            user=self, is_active=True, club__in=Club.objects.all()
+        ).aggregate(
+            owned_count=Count("club", distinct=True, filter=Q(role="owner")),
+            managed_count=Count(
+                "club", distinct=True, filter=Q(role__in=("owner", "admin"))
+            ),
+            all_count=Count("club", distinct=True),
         )
 
-        owned_clubs = []
-        managed_clubs = []
+    def get_club_permissions_lists(self) -> dict:
+        """
+        Load the user's clubs, classified by role.
+
+        Returns:
+            Dictionary with owned_clubs, managed_clubs and all_clubs lists
+        """
+        Club, ClubStaff = _clubs_model("Club"), _clubs_model("ClubStaff")
 
-        for club in clubs_with_assignments:
-            # Check assignments for this club
-            user_assignments = [
-                assignment
-                for assignment in club.staff_assignments.all()
-                if assignment.user == self and assignment.is_active
-            ]
+        if not self.contact_id:
+            return {"owned_clubs": [], "managed_clubs": [], "all_clubs": []}
+
+        # Classify clubs by ID from the (club_id, role) pairs alone, then load
+        # the clubs once; no per-club assignment prefetch is shipped back
+        owned_ids, managed_ids, club_ids = set(), set(), set()
+        for club_id, role in ClubStaff.all_objects.filter(
+            user=self, is_active=True
+        ).values_list("club_id", "role"):
+            club_ids.add(club_id)
+            if role == "owner":
+                owned_ids.add(club_id)
+            if role in ("owner", "admin"):
+                managed_ids.add(club_id)
+
+        # Club *is* the Organization (multi-table inheritance)
+        all_clubs = list(Club.objects.select_related("tenant").filter(pk__in=club_ids))
 
-            if any(assignment.role == "owner" for assignment in user_assignments):
-                owned_clubs.append(club)
+        return {
+            "owned_clubs": [club for club in all_clubs if club.pk in owned_ids],
+            "managed_clubs": [club for club in all_clubs if club.pk in managed_ids],
+            "all_clubs": all_clubs,
+        }
 
-            if any(
-                assignment.role in ["owner", "manager"]
-                for assignment in user_assignments
-            ):
-                managed_clubs.append(club)
+    def get_club_permissions_summary(self) -> dict:
+        """
+        Get comprehensive summary of user's club permissions.
+
+        The club lists are lazy: they are loaded (together, once) on first
+        use, so callers that only need counts should use
+        get_club_permissions_counts() instead.
+
+        Returns:
+            Dictionary containing permission summary with lazily loaded club lists
+        """
+        lists = SimpleLazyObject(self.get_club_permissions_lists)
 
         return {
             "is_admin": self.is_system_admin,
-            "owned_clubs": owned_clubs,
-            "managed_clubs": managed_clubs,
-            "all_clubs": list(clubs_with_assignments),
+            "owned_clubs": SimpleLazyObject(lambda: lists["owned_clubs"]),
+            "managed_clubs": SimpleLazyObject(lambda: lists["managed_clubs"]),
+            "all_clubs": SimpleLazyObject(lambda: lists["all_clubs"]),
             "can_create_clubs": self.can_create_clubs,
             "can_manage_members": self.can_manage_members,
         }
 
+    @property
+    def tenant_id(self) -> Optional[int]:
+        """Tenant ID of the associated contact (no query once contact is loaded)"""
+        return self.contact.tenant_id
+
     def can_access_tenant(self, tenant: TenantAccount) -> bool:
         """Check if user can access specific tenant - required by middleware"""
-        return self.contact.tenant == tenant
+        return self.tenant_id == getattr(tenant, "pk", None)
 
     def get_tenant_account(self) -> Optional[TenantAccount]:
         """Get user's tenant account - required by middleware"""
@@ -450,6 +743,43 @@ class UserProfile(models.Model):
             self.can_create_clubs = True
             self.can_manage_members = True
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Override save to keep the Django User's flags in sync"""
+        self.__dict__.pop("_is_owner_of_any", None)
+        self.__dict__.pop("_org_roles", None)
+        self.__dict__.pop("club_permissions_summary", None)
+        super().save(*args, **kwargs)
+
+        # Partial saves of unrelated fields cannot change the User's flags
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or not _USER_SYNC_FIELDS.isdisjoint(update_fields):
+            self._sync_user()
+
+    def refresh_from_db(self, *args: Any, **kwargs: Any) -> None:
+        """Reload from the database, dropping cached roles and permission flags"""
+        self.__dict__.pop("_org_roles", None)
+        self.__dict__.pop("club_permissions_summary", None)
+        super().refresh_from_db(*args, **kwargs)
+
+    def _sync_user(self) -> None:
+        """Sync Django User permissions with UserProfile permissions"""
+        user = self.user
+
+        # Set Django User active status based on Contact active status
+        is_active = self.contact.is_active if self.contact_id else user.is_active
+
+        # Set Django staff status for club owners/admins (never revoked here)
+        is_staff = user.is_staff or self.is_system_admin or self.is_club_owner()
+
+        # Skip the write entirely when nothing changed
+        if (user.is_active, user.is_staff) == (is_active, is_staff):
+            return
+
+        user.is_active = is_active
+        user.is_staff = is_staff
+        # QuerySet.update() writes the row without re-firing User post_save
+        User.objects.filter(pk=user.pk).update(is_active=is_active, is_staff=is_staff)
+
 
 # Signal handlers for UserProfile
 @receiver(post_save, sender=User)
@@ -460,21 +790,3 @@ def create_user_profile(
     # This will be called when creating User accounts
     # Implementation can be added later when user registration is implemented
     pass
-
-
-@receiver(post_save, sender=UserProfile)
-def sync_user_permissions(
-    sender: type[UserProfile], instance: UserProfile, **kwargs: Any
-) -> None:
-    """Sync Django User permissions with UserProfile permissions"""
-    user = instance.user
-
-    # Set Django User active status based on Contact active status
-    if hasattr(instance, "contact") and instance.contact:
-        user.is_active = instance.contact.is_active
-
-    # Set Django staff status for club owners/admins
-    if instance.is_club_owner() or instance.is_system_admin:
-        user.is_staff = True
-
-    user.save(update_fields=["is_active", "is_staff"])
@@ -6,24 +6,37 @@ IDE support and type checking.
 """
 
 from __future__ import annotations
-from typing import Any, List, Optional, Union, TYPE_CHECKING
-from decimal import Decimal
+from datetime import date
+from typing import Any, Iterable, List, NamedTuple, Optional, TYPE_CHECKING
 
 from django.contrib.auth.models import User
-from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models.signals import post_save
-from django.dispatch import receiver
-from django.urls import reverse
-from django.utils import timezone
 
-from accounts.managers import OrganizationAwareManager, TenantAwareManager
+from accounts.managers import TenantAwareManager
+
+from .managers import ContactManager
 
 if TYPE_CHECKING:
-    from typing import Dict
-    from django.db.models import QuerySet
-    from accounts.models import TenantAccount, MemberAccount, PaymentHistory
-    from organizations.models import Organization
+    from accounts.models import TenantAccount
+    from clubs.models import Club
+    from organizations.models import Organization, OrganizationUser
+
+
+class ClubPermsSummary(NamedTuple):
+    """Lightweight, immutable summary returned by UserProfile.club_permissions_summary"""
+
+    is_admin: bool
+    can_create_clubs: bool
+    can_manage_members: bool
+    is_club_owner: bool
+
+
+class CurrentDate(models.Func):
+    """SQL CURRENT_DATE (unlike Now(), SQLite allows it in CHECK constraints)"""
+
+    template: str
+    output_field: models.DateField
+
 
 class Contact(models.Model):
     """Contact model for personal information relating to a person"""
@@ -37,11 +50,23 @@ class Contact(models.Model):
     mobile_number: models.CharField
     email: models.EmailField
 
+    # Stored "last_name first_name" used for ordering
+    sort_name: models.GeneratedField
+
+    # Emergency and medical information
+    emergency_contact_name: models.CharField
+    emergency_contact_phone: models.CharField
+    emergency_contact_relationship: models.CharField
+    medical_conditions: models.TextField
+    medical_clearance_date: models.DateField
+
     # Tenant relationship for multi-tenant isolation
     tenant: models.ForeignKey[TenantAccount]
+    tenant_id: Optional[int]
 
     # Organization relationship for direct organization membership
     organization: models.ForeignKey[Organization]
+    organization_id: Optional[int]
 
     # Metadata Fields for auditing and soft delete
     created_at: models.DateTimeField
@@ -49,38 +74,49 @@ class Contact(models.Model):
     is_active: models.BooleanField
 
     # Organization and tenant-aware managers
-    objects: OrganizationAwareManager[Contact]
+    objects: ContactManager
     all_objects: models.Manager[Contact]
-    tenant_objects: TenantAwareManager[Contact]
+    tenant_objects: TenantAwareManager
 
     # === ORIGINAL MODEL METHODS ===
     def __str__(self) -> str: ...
     def get_full_name(self) -> str: ...
-    def get_age(self) -> Optional[int]: ...
+    @classmethod
+    def list_queryset(cls) -> models.QuerySet[Contact]: ...
+    @classmethod
+    def bulk_import(
+        cls, objs: Iterable[Contact], batch_size: int = 1000
+    ) -> List[Contact]: ...
+    def get_age(self, today: Optional[date] = None) -> Optional[int]: ...
+    @property
+    def age(self) -> Optional[int]: ...
     def get_absolute_url(self) -> str: ...
     def clean(self) -> None: ...
+    def save(self, *args: Any, **kwargs: Any) -> None: ...
     def get_organization(self) -> Optional[Organization]: ...
     def can_access_organization(self, organization: Organization) -> bool: ...
     def get_all_organizations(self) -> List[Organization]: ...
 
 
+class UserProfileQuerySet(models.QuerySet[UserProfile]):
+    """QuerySet for UserProfile with common eager-loading helpers"""
+
+    def with_context(self) -> UserProfileQuerySet: ...
+    def with_club_assignments(self) -> UserProfileQuerySet: ...
 
-class LoginUser(models.Model):
-    """LoginUser model for contacts that can login and manage club membership"""
+
+class UserProfile(models.Model):
+    """UserProfile model for contacts that can login and manage club membership"""
 
     # === ORIGINAL MODEL FIELDS ===
     # Relationship Fields
     user: models.OneToOneField[User]
+    user_id: int
     contact: models.OneToOneField[Contact]
+    contact_id: Optional[int]
 
     # Permission Fields for club management
-    is_club_owner: models.BooleanField
-    is_club_staff: models.BooleanField
-
-    PERMISSION_CHOICES: List[tuple[str, str]]
-    permissions_level: models.CharField
-
-    # Additional Fields for club management
+    is_system_admin: models.BooleanField
     can_create_clubs: models.BooleanField
     can_manage_members: models.BooleanField
 
@@ -89,27 +125,50 @@ class LoginUser(models.Model):
     updated_at: models.DateTimeField
     last_login_attempt: models.DateTimeField
 
+    objects: UserProfileQuerySet
+
     # === ORIGINAL MODEL METHODS ===
     def __str__(self) -> str: ...
+    @classmethod
+    def list_queryset(cls) -> models.QuerySet[UserProfile]: ...
+    @classmethod
+    def bulk_import(
+        cls, objs: Iterable[UserProfile], batch_size: int = 1000
+    ) -> List[UserProfile]: ...
+    @classmethod
+    def bulk_sync_users(
+        cls, profiles: Iterable[UserProfile], batch_size: int = 1000
+    ) -> None: ...
+    @classmethod
+    def bulk_sync_organization_admins(
+        cls, organization_users: Iterable[OrganizationUser], batch_size: int = 1000
+    ) -> None: ...
+    def is_club_owner(self, club: Optional[Club] = None) -> bool: ...
     def has_club_permissions(self) -> bool: ...
     def can_manage_club(self, club: Any = None) -> bool: ...
-    def get_managed_clubs(self) -> None: ...
+    def get_managed_clubs(self) -> models.QuerySet[Club]: ...
+    @property
+    def club_permissions_summary(self) -> ClubPermsSummary: ...
     def can_access_organization(self, organization: Organization) -> bool: ...
     def is_organization_admin(self, organization: Organization) -> bool: ...
     def is_organization_owner(self, organization: Organization) -> bool: ...
     def get_organizations(self) -> List[Organization]: ...
+    def get_organization_ids(self) -> List[int]: ...
+    def get_organization_pairs(self) -> List[tuple[int, str]]: ...
     def get_organization_permission_level(self, organization: Organization) -> Optional[str]: ...
+    def get_club_permissions_counts(self) -> dict[str, int]: ...
+    def get_club_permissions_lists(self) -> dict[str, List[Club]]: ...
+    def get_club_permissions_summary(self) -> dict[str, Any]: ...
+    @property
+    def tenant_id(self) -> Optional[int]: ...
     def can_access_tenant(self, tenant: TenantAccount) -> bool: ...
     def get_tenant_account(self) -> Optional[TenantAccount]: ...
     def clean(self) -> None: ...
-
+    def save(self, *args: Any, **kwargs: Any) -> None: ...
+    def refresh_from_db(self, *args: Any, **kwargs: Any) -> None: ...
 
 
 # === SIGNAL HANDLERS ===
-def create_login_user_profile(sender: type[User], instance: User, created: bool, **kwargs: Any) -> None:
-    """Create LoginUser profile when User is created (optional)"""
+def create_user_profile(sender: type[User], instance: User, created: bool, **kwargs: Any) -> None:
+    """Create UserProfile profile when User is created (optional)"""
     ...
-
-def sync_user_permissions(sender: type[LoginUser], instance: LoginUser, **kwargs: Any) -> None:
-    """Sync Django User permissions with LoginUser permissions"""
-    ...
\ No newline at end of file
@@ -3,69 +3,124 @@ Signal handlers for organization awareness in people app models.
 Sync Contact.organization with django-organizations membership changes.
 """
 
+import functools
+from contextvars import ContextVar
+
+from django.contrib.auth.models import User
 from django.dispatch import receiver
-from django.db.models.signals import post_save
+from django.db.models import Case, Exists, F, OuterRef, Subquery, Value, When
+from django.db.models.signals import post_init, post_save
 from organizations.signals import user_added, user_removed, owner_changed
 from organizations.models import Organization, OrganizationUser
 
 
+# Handlers running in the current thread/task; writes made by a handler that
+# re-send its own signal are not handled again
+_active_handlers: ContextVar[frozenset] = ContextVar(
+    'active_signal_handlers', default=frozenset()
+)
+
+
+def _non_reentrant(handler):
+    """Skip calls to handler made while it is already running."""
+
+    @functools.wraps(handler)
+    def wrapper(*args, **kwargs):
+        active = _active_handlers.get()
+        if handler in active:
+            return None
+        token = _active_handlers.set(active | {handler})
+        try:
+            return handler(*args, **kwargs)
+        finally:
+            _active_handlers.reset(token)
+
+    return wrapper
+
+
+def _get_user_profile(user):
+    """
+    Get the user's UserProfile (or None), memoized on the user instance.
+
+    The result is stored in the reverse one-to-one cache, so handlers firing
+    for the same user within a request (and ``user.profile``) reuse it.
+    """
+    from .models import UserProfile
+
+    related = User.profile.related
+    if not related.is_cached(user):
+        # Handlers only read the contact; the user is the one passed in, so
+        # it is linked back instead of being joined and re-read
+        user_profile = (
+            UserProfile.objects.select_related('contact').filter(user=user).first()
+        )
+        if user_profile is not None:
+            UserProfile.user.field.set_cached_value(user_profile, user)
+        related.set_cached_value(user, user_profile)
+    return related.get_cached_value(user)
+
+
 @receiver(user_added, sender=Organization)
+@_non_reentrant
 def sync_contact_organization_on_add(sender, user, organization, **kwargs):
     """
     Update Contact.organization when user is added to organization.
 
     This ensures Contact model stays in sync with django-organizations membership.
     """
-    from .models import UserProfile
+    from .models import Contact
 
-    try:
-        user_profile = UserProfile.objects.get(user=user)
-        contact = user_profile.contact
-
-        # Set organization if contact doesn't have one, or if this is a higher priority org
-        if not contact.organization:
-            contact.organization = organization
-            contact.save(update_fields=['organization'])
-    except UserProfile.DoesNotExist:
+    user_profile = _get_user_profile(user)
+    if user_profile is None:
         # User exists in django-organizations but not in our UserProfile system
         # This is normal for admin users who may not have Contact records
-        pass
+        return
+
+    contact = user_profile.contact
+
+    # Set organization if contact doesn't have one. The row condition decides,
+    # not the memoized contact, which other writes may have made stale. No
+    # Contact.save() hook depends on organization, so QuerySet.update() is
+    # used and no Contact signals are dispatched
+    updated = Contact.all_objects.filter(
+        pk=contact.pk, organization__isnull=True
+    ).update(organization=organization)
+    if updated:
+        contact.organization = organization
 
 
 @receiver(user_removed, sender=Organization)
+@_non_reentrant
 def sync_contact_organization_on_remove(sender, user, organization, **kwargs):
     """
     Handle Contact.organization cleanup when user is removed from organization.
     
     Reassigns to another organization if user has other memberships.
     """
-    from .models import UserProfile
-    
-    try:
-        user_profile = UserProfile.objects.get(user=user)
-        contact = user_profile.contact
-        
-        if contact.organization == organization:
-            # Find other organization memberships for this user
-            other_orgs = OrganizationUser.objects.filter(
-                user=user
-            ).exclude(
-                organization=organization
-            ).select_related('organization')
-            
-            if other_orgs.exists():
-                # Assign to first remaining organization
-                contact.organization = other_orgs.first().organization
-            else:
-                # No other organization memberships, clear organization
-                contact.organization = None
-                
-            contact.save(update_fields=['organization'])
-    except UserProfile.DoesNotExist:
-        pass
+    from .models import Contact
+
+    # Reassign to the first remaining membership, or NULL when there is none
+    # (empty subquery), in a single UPDATE that only matches contacts of this
+    # user still pointing at the organization being left
+    other_orgs = OrganizationUser.objects.filter(
+        user=user
+    ).exclude(
+        organization=organization
+    ).order_by('pk').values('organization')[:1]
+
+    updated = Contact.all_objects.filter(
+        user_profile__user=user, organization=organization
+    ).update(organization=Subquery(other_orgs))
+
+    # The new organization is only known to the database; drop a profile
+    # memoized on the user so its contact is not read stale
+    related = User.profile.related
+    if updated and related.is_cached(user):
+        related.delete_cached_value(user)
 
 
 @receiver(owner_changed, sender=Organization)
+@_non_reentrant
 def update_owner_permissions(sender, organization, old_owner, new_owner, **kwargs):
     """
     Update UserProfile permissions when organization ownership changes.
@@ -73,36 +128,49 @@ def update_owner_permissions(sender, organization, old_owner, new_owner, **kwarg
     Ensures UserProfile permission levels reflect organization ownership.
     """
     from .models import UserProfile
-    
-    # Update old owner's permissions if they have UserProfile
-    if old_owner:
-        try:
-            old_user_profile = UserProfile.objects.get(user=old_owner)
-            # Demote from admin if they're not admin in other orgs
-            other_admin_orgs = OrganizationUser.objects.filter(
-                user=old_owner, is_admin=True
-            ).exclude(organization=organization)
-            
-            if not other_admin_orgs.exists() and old_user_profile.is_system_admin:
-                # Demote system admin to regular owner
-                old_user_profile.is_system_admin = False
-                old_user_profile.save(update_fields=['is_system_admin'])
-        except UserProfile.DoesNotExist:
-            pass
-    
-    # Update new owner's permissions if they have UserProfile  
+
+    owners = [owner for owner in (old_owner, new_owner) if owner]
+    if not owners:
+        return
+
+    # Promote the new owner and demote the old one (unless they're admin in
+    # other orgs) in a single UPDATE over both profiles; the "admin
+    # elsewhere" check is a correlated EXISTS
+    other_admin_orgs = OrganizationUser.objects.filter(
+        user=OuterRef('user'), is_admin=True
+    ).exclude(organization=organization)
+    new_owner_id = new_owner.pk if new_owner else None
+    UserProfile.objects.filter(user__in=owners).exclude(
+        user_id=new_owner_id, is_system_admin=True
+    ).update(
+        is_system_admin=Case(
+            When(user_id=new_owner_id, then=Value(True)),
+            When(Exists(other_admin_orgs), then=F('is_system_admin')),
+            default=Value(False),
+        )
+    )
+
     if new_owner:
-        try:
-            new_user_profile = UserProfile.objects.get(user=new_owner)
-            # Promote to admin level if not already
-            if not new_user_profile.is_system_admin:
-                new_user_profile.is_system_admin = True
-                new_user_profile.save(update_fields=['is_system_admin'])
-        except UserProfile.DoesNotExist:
-            pass
+        # update() skips UserProfile.save(), so mirror its staff sync
+        User.objects.filter(
+            pk=new_owner.pk, profile__is_system_admin=True, is_staff=False
+        ).update(is_staff=True)
+
+
+@receiver(post_init, sender=OrganizationUser)
+def remember_synced_is_admin(sender, instance, **kwargs):
+    """
+    Snapshot is_admin of stored OrganizationUser rows.
+
+    Lets sync_loginuser_permissions skip saves that leave is_admin unchanged.
+    Deferred is_admin is not touched, as reading it would load the field.
+    """
+    if instance.pk is not None and 'is_admin' in instance.__dict__:
+        instance._synced_is_admin = instance.is_admin
 
 
 @receiver(post_save, sender=OrganizationUser)
+@_non_reentrant
 def sync_loginuser_permissions(sender, instance, created, **kwargs):
     """
     Sync UserProfile permissions when OrganizationUser admin status changes.
@@ -110,25 +178,45 @@ def sync_loginuser_permissions(sender, instance, created, **kwargs):
     Ensures bidirectional sync between django-organizations and UserProfile permissions.
     """
     from .models import UserProfile
-    
-    try:
-        user_profile = UserProfile.objects.get(user=instance.user)
-        
-        if instance.is_admin:
-            # Promote UserProfile to system admin if they're org admin
-            if not user_profile.is_system_admin:
-                user_profile.is_system_admin = True
-                user_profile.save(update_fields=['is_system_admin'])
-        else:
-            # Check if user is admin in any other organizations
-            is_admin_elsewhere = OrganizationUser.objects.filter(
-                user=instance.user, is_admin=True
-            ).exclude(id=instance.id).exists()
-            
-            if not is_admin_elsewhere and user_profile.is_system_admin:
-                # Demote from system admin if not admin elsewhere
-                user_profile.is_system_admin = False
-                user_profile.save(update_fields=['is_system_admin'])
-                
-    except UserProfile.DoesNotExist:
-        pass
\ No newline at end of file
+
+    # Nothing to sync when the save did not touch is_admin
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and 'is_admin' not in update_fields:
+        return
+    if not created and instance.__dict__.get('_synced_is_admin') == instance.is_admin:
+        return
+    instance._synced_is_admin = instance.is_admin
+
+    # Conditional UPDATEs decide and write in one statement each, without
+    # loading the profile; QuerySet.update() sends no UserProfile signals
+    user_profiles = UserProfile.objects.filter(user_id=instance.user_id)
+
+    if instance.is_admin:
+        # Promote UserProfile to system admin if they're org admin
+        promoted = user_profiles.filter(is_system_admin=False).update(
+            is_system_admin=True
+        )
+        if promoted:
+            # Promotion grants staff status, as UserProfile.save() would have
+            User.objects.filter(pk=instance.user_id, is_staff=False).update(
+                is_staff=True
+            )
+        changed, is_system_admin = promoted, True
+    else:
+        # Demote from system admin unless they're admin in other organizations
+        admin_elsewhere = OrganizationUser.objects.filter(
+            user=OuterRef('user'), is_admin=True
+        ).exclude(pk=instance.pk)
+        changed = user_profiles.filter(is_system_admin=True).exclude(
+            Exists(admin_elsewhere)
+        ).update(is_system_admin=False)
+        is_system_admin = False
+
+    # Keep a profile memoized on the user instance in step with the row; an
+    # unloaded instance.user has nothing memoized, so don't fetch it
+    if changed and OrganizationUser.user.is_cached(instance):
+        cached_profile = User.profile.related.get_cached_value(
+            instance.user, default=None
+        )
+        if cached_profile is not None:
+            cached_profile.is_system_admin = is_system_admin